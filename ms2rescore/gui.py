@@ -3,27 +3,28 @@
 import argparse
 import ast
 import json
-import logging
-import pprint
-import multiprocessing
+import os
+import sys
+from typing import Union
 
 
 from gooey import Gooey, GooeyParser, local_resource_path
-from ms2pip.ms2pipC import MODELS as ms2pip_models
-from ms2rescore import MS2ReScore, package_data
+from ms2rescore import package_data
 from ms2rescore._exceptions import MS2RescoreError
 
-try:
-    import importlib.resources as pkg_resources
-except ImportError:
-    import importlib_resources as pkg_resources
 
+# package_data is always a directory on disk, so no need for importlib.resources
+package_data_dir = os.path.dirname(package_data.__file__)
+img_dir = local_resource_path(os.path.join(package_data_dir, "img"))
 
-logger = logging.getLogger(__name__)
-
-
-with pkg_resources.path(package_data, "img") as img_dir:
-    img_dir = local_resource_path(img_dir)
+# GUI arguments that are moved out of the general configuration by parse_settings
+_STRUCTURED_KEYS = frozenset({
+    "modification_mapping",
+    "fixed_modifications",
+    "ms2pip_model",
+    "ms2pip_frag_error",
+    "ms2pip_modifications",
+})
 
 
 class MS2RescoreGUIError(MS2RescoreError):
@@ -41,16 +42,47 @@ class MS2RescoreGUIError(MS2RescoreError):
 )
 def main():
     """Run MS²Rescore."""
-    conf = _parse_arguments().__dict__
-    conf = parse_settings(conf)
+    conf = parse_settings(_parse_arguments())
+
+    # Deferred, as importing MS2ReScore loads pandas, ms2pip, matplotlib, etc.
+    from ms2rescore import MS2ReScore
+
     rescore = MS2ReScore(parse_cli_args=False, configuration=conf, set_logger=True)
     rescore.run()
 
 
+def _loads_json(data: Union[str, bytes]):
+    """Deserialize JSON, using orjson if available."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    else:
+        return orjson.loads(data)
+
+
+def _load_ms2pip_modifications_text() -> str:
+    """Load JSON-formatted default MS²PIP modifications."""
+    try:
+        # Generated at build time, see setup.py
+        from ms2rescore.package_data import _config_default_cached
+    except ImportError:
+        config_path = os.path.join(package_data_dir, "config_default.json")
+        with open(config_path, "rb") as f:
+            default_config = _loads_json(f.read())
+        return json.dumps(default_config["ms2pip"]["modifications"], indent=2)
+    else:
+        return _config_default_cached.MS2PIP_MODS_TEXT
+
+
 def _parse_arguments() -> argparse.Namespace:
     """Parse GUI arguments."""
-    default_config = json.load(pkg_resources.open_text(package_data, "config_default.json"))
-    ms2pip_mods = default_config["ms2pip"]["modifications"]
+    return _build_parser().parse_args()
+
+
+def _build_parser() -> GooeyParser:
+    """Build GUI argument parser."""
+    ms2pip_mods_text = _load_ms2pip_modifications_text()
 
     parser = GooeyParser()
     general = parser.add_argument_group("General configuration")
@@ -175,6 +207,9 @@ def _parse_arguments() -> argparse.Namespace:
         },
     )
 
+    # Deferred, as importing ms2pip also loads numpy and pandas
+    from ms2pip.ms2pipC import MODELS as ms2pip_models
+
     ms2pip_settings = parser.add_argument_group(
         "MS²PIP settings"
     )
@@ -186,7 +221,7 @@ def _parse_arguments() -> argparse.Namespace:
         default="HCD2021",
         help="MS²PIP prediction model to use",
         widget="Dropdown",
-        choices=ms2pip_models.keys(),
+        choices=tuple(ms2pip_models),
     )
     ms2pip_settings.add_argument(
         "--ms2pip_frag_error",
@@ -203,9 +238,9 @@ def _parse_arguments() -> argparse.Namespace:
         action="store",
         type=str,
         dest="ms2pip_modifications",
-        default=pprint.pformat(ms2pip_mods, compact=True, width=200),
+        default=ms2pip_mods_text,
         help=(
-            "List of modification definition dictionaries for MS²PIP. See online "
+            "JSON list of modification definition objects for MS²PIP. See online "
             "documentation for more info."
         ),
         widget="Textarea",
@@ -215,54 +250,80 @@ def _parse_arguments() -> argparse.Namespace:
         },
     )
 
-    return parser.parse_args()
+    return parser
 
-def parse_settings(config:dict) -> dict:
+def parse_settings(args: argparse.Namespace) -> dict:
     "Parse non-general settings into one dict"
-
-    parsed_config = {
-        "general" : config,
-        "maxquant_to_rescore": {},
-        "ms2pip": {},
+    args = vars(args)
+    return {
+        "general": {k: v for k, v in args.items() if k not in _STRUCTURED_KEYS},
+        "maxquant_to_rescore": {
+            "modification_mapping": _parse_maxquant_modifications(
+                args["modification_mapping"]
+            ),
+            "fixed_modifications": _parse_maxquant_modifications(
+                args["fixed_modifications"]
+            ),
+        },
+        "ms2pip": {
+            "model": args["ms2pip_model"],
+            "frag_error": args["ms2pip_frag_error"],
+            "modifications": _parse_ms2pip_modifications(args["ms2pip_modifications"]),
+        },
     }
 
-    # MaxQuant configuration
-    for conf_item in ["modification_mapping", "fixed_modifications"]:
-        parsed_conf_item = parsed_config["general"].pop(conf_item)
-        try:
-            if parsed_conf_item:
-                parsed_conf_item = parsed_conf_item.split("\n")
-                parsed_conf_item = dict([tuple(x.split(" ")) for x in parsed_conf_item])
-            else:
-                parsed_conf_item = {}
-            parsed_config["maxquant_to_rescore"][conf_item] = parsed_conf_item
-        except Exception:
+
+def _parse_maxquant_modifications(conf_item: str) -> dict:
+    """Parse MaxQuant modification textarea into dict."""
+    if not conf_item:
+        return {}
+    pairs = []
+    for line_number, line in enumerate(conf_item.splitlines(), start=1):
+        parts = line.split(None, 1)
+        if not parts:
+            continue
+        if len(parts) != 2:
             raise MS2RescoreGUIError(
-                "Invalid MaxQuant modification configuration. Make sure that the "
-                "modification configuration fields are formatted correctly."
+                f"Invalid MaxQuant modification configuration on line {line_number}: "
+                f"`{line.strip()}`. Make sure that each line contains a label and a "
+                "modification name, separated by whitespace."
             )
+        pairs.append((parts[0], parts[1].strip()))
+    return dict(pairs)
 
-    # MS²PIP configuration
-    parsed_config["ms2pip"] = {
-        "model": parsed_config["general"].pop("ms2pip_model"),
-        "frag_error": parsed_config["general"].pop("ms2pip_frag_error"),
-    }
 
+def _parse_ms2pip_modifications(conf_item: str) -> list:
+    """Parse MS²PIP modification definitions textarea into list of dicts."""
     try:
-        parsed_config["ms2pip"]["modifications"] =  ast.literal_eval(
-            parsed_config["general"].pop("ms2pip_modifications")
-        )
-    except Exception:
+        modifications = _loads_json(conf_item)
+    except json.JSONDecodeError as json_error:
+        # Legacy input: Python literal, as formerly shown in the GUI
+        try:
+            modifications = ast.literal_eval(conf_item)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            raise MS2RescoreGUIError(
+                f"Invalid MS²PIP modification configuration: {json_error.msg} "
+                f"(line {json_error.lineno}, column {json_error.colno}). "
+                "Make sure that the modification configuration field contains a valid "
+                "JSON list of modification definitions."
+            ) from None
+
+    if not isinstance(modifications, list) or not all(
+        isinstance(mod, dict) for mod in modifications
+    ):
         raise MS2RescoreGUIError(
             "Invalid MS²PIP modification configuration. Make sure that the "
-            "modification configuration field is formatted correctly."
+            "modification configuration field contains a JSON list of modification "
+            "definition objects."
         )
-
-    return parsed_config
+    return modifications
 
 
 if __name__ == "__main__":
     # Required for PyInstalller package (https://github.com/pyinstaller/pyinstaller/wiki/Recipe-Multiprocessing)
-    # Avoids opening new windows upon multiprocessing
-    multiprocessing.freeze_support()
+    # Avoids opening new windows upon multiprocessing. No-op unless frozen.
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+
+        multiprocessing.freeze_support()
     main()
@@ -1,7 +1,30 @@
 #! python
 """Setup ms2rescore."""
 
+import json
+import os
+
 from setuptools import setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithConfigCache(build_py):
+    """Build package and cache the default MS²PIP modifications as a Python module."""
+
+    def run(self):
+        super().run()
+        if not self.dry_run:
+            write_config_cache(os.path.join(self.build_lib, "ms2rescore", "package_data"))
+
+
+def write_config_cache(package_data_dir):
+    """Write `_config_default_cached.py`, used by the GUI to skip parsing at launch."""
+    with open(os.path.join("ms2rescore", "package_data", "config_default.json"), "rt") as f:
+        default_config = json.load(f)
+    ms2pip_mods_text = json.dumps(default_config["ms2pip"]["modifications"], indent=2)
+    with open(os.path.join(package_data_dir, "_config_default_cached.py"), "wt") as f:
+        f.write('"""Generated from config_default.json at build time."""\n\n')
+        f.write(f"MS2PIP_MODS_TEXT = {ms2pip_mods_text!r}\n")
 
 
 def get_version(path):
@@ -55,6 +78,7 @@ setup(
     ],
     packages=["ms2rescore"],
     include_package_data=True,
+    cmdclass={"build_py": BuildPyWithConfigCache},
     entry_points={"console_scripts": [
         "ms2rescore=ms2rescore.__main__:main",
     ]},
@@ -77,7 +101,7 @@ setup(
         "deeplc>=0.1.17",
     ],
     extras_require={
-        "gui": ["gooey>=1.0"],
+        "gui": ["gooey>=1.0", "orjson"],
     },
     test_suite="tests",
     tests_require=["ms2rescore", "pytest>=4.3.0,<5"],
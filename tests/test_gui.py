@@ -0,0 +1,94 @@
+"""gui module unit tests."""
+
+import json
+
+import pytest
+
+pytest.importorskip("gooey")
+
+from ms2rescore.gui import (  # noqa: E402
+    MS2RescoreGUIError,
+    _build_parser,
+    _parse_maxquant_modifications,
+    _parse_ms2pip_modifications,
+    parse_settings,
+)
+
+
+class TestParseMaxQuantModifications:
+    def test_empty(self):
+        assert _parse_maxquant_modifications("") == {}
+        assert _parse_maxquant_modifications(None) == {}
+
+    def test_whitespace_and_blank_lines(self):
+        conf_item = "cm Carbamidomethyl\n\nox  Oxidation \n   \ngl\tGln->pyro-Glu\n"
+        expected = {
+            "cm": "Carbamidomethyl",
+            "ox": "Oxidation",
+            "gl": "Gln->pyro-Glu",
+        }
+        assert _parse_maxquant_modifications(conf_item) == expected
+
+    def test_invalid_line(self):
+        with pytest.raises(MS2RescoreGUIError, match="line 3"):
+            _parse_maxquant_modifications("cm Carbamidomethyl\n\nox\n")
+
+
+class TestParseMS2PIPModifications:
+    modifications = [
+        {
+            "name": "Oxidation",
+            "unimod_accession": 35,
+            "mass_shift": 15.994915,
+            "amino_acid": "M",
+            "n_term": False,
+            "c_term": False,
+        }
+    ]
+
+    def test_json(self):
+        conf_item = json.dumps(self.modifications, indent=2)
+        assert _parse_ms2pip_modifications(conf_item) == self.modifications
+
+    def test_legacy_python_literal(self):
+        conf_item = repr(self.modifications)
+        assert _parse_ms2pip_modifications(conf_item) == self.modifications
+
+    def test_invalid_json(self):
+        with pytest.raises(MS2RescoreGUIError, match=r"line 2, column 12"):
+            _parse_ms2pip_modifications('[\n  {"name": Oxidation}\n]')
+
+    @pytest.mark.parametrize("conf_item", ["{[1]: 2}", "()", "{}", "[1, 2]"])
+    def test_invalid_type(self, conf_item):
+        with pytest.raises(MS2RescoreGUIError):
+            _parse_ms2pip_modifications(conf_item)
+
+
+class TestParseSettings:
+    def test_parse_settings(self):
+        args = _build_parser().parse_args(
+            [
+                "msms.txt",
+                "--modification_mapping",
+                "ox Oxidation\nac Acetyl",
+                "--fixed_modifications",
+                "",
+                "--ms2pip_model",
+                "HCD2021",
+            ]
+        )
+        args_before = vars(args).copy()
+        config = parse_settings(args)
+
+        assert vars(args) == args_before
+        assert config["general"]["identification_file"] == "msms.txt"
+        assert "ms2pip_modifications" not in config["general"]
+        assert "modification_mapping" not in config["general"]
+        assert config["maxquant_to_rescore"] == {
+            "modification_mapping": {"ox": "Oxidation", "ac": "Acetyl"},
+            "fixed_modifications": {},
+        }
+        assert config["ms2pip"]["model"] == "HCD2021"
+        assert config["ms2pip"]["frag_error"] == 0.02
+        assert isinstance(config["ms2pip"]["modifications"], list)
+        assert all(isinstance(mod, dict) for mod in config["ms2pip"]["modifications"])